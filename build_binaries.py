@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """Build standalone executables for Impulse Check"""
 
+import argparse
 import os
 import platform
 import subprocess
 import shutil
 from pathlib import Path
 
-def build_executable():
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build standalone executables for Impulse Check')
+    parser.add_argument('--single-file', action='store_true',
+                        help='Build a self-extracting --onefile binary (slower to start)')
+    return parser.parse_args()
+
+def build_executable(single_file=False):
     """Build standalone executable using PyInstaller"""
     system = platform.system().lower()
     print(f"Building for {system}...")
@@ -22,34 +29,48 @@ def build_executable():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Build the executable
+    # --onedir avoids unpacking the whole runtime to a temp dir on every launch
+    name = f"impulse-check-{system}"
     cmd = [
         "pyinstaller",
-        "--onefile",
+        "--onefile" if single_file else "--onedir",
         "--clean",
-        "--name", f"impulse-check-{system}",
+        "--noupx",
+        "--name", name,
         "main.py"
     ]
     
     if system == "windows":
         # Add icon for Windows
         cmd.extend(["--icon", "icon.ico"])
-    elif system == "darwin":  # macOS
-        cmd.extend(["--windowed"])  # Creates a .app on macOS
+    else:
+        cmd.extend(["--strip"])  # Strip symbols from the bundled libraries
+        if system == "darwin":  # macOS
+            cmd.extend(["--windowed"])  # Creates a .app on macOS
     
-    subprocess.run(cmd, check=True)
+    # Bundle -OO bytecode (no asserts or docstrings); stale caches must go
+    # first or PyInstaller picks up the unoptimized .pyc files
+    shutil.rmtree("__pycache__", ignore_errors=True)
+    env = dict(os.environ, PYTHONOPTIMIZE="2")
+    subprocess.run(cmd, env=env, check=True)
     
     # Move the executable to the output directory
     if system == "darwin":
         app_path = Path("dist") / "impulse-check-darwin.app"
         if app_path.exists():
             shutil.move(str(app_path), str(output_dir))
-    else:
-        exe_name = "impulse-check-windows.exe" if system == "windows" else f"impulse-check-{system}"
+    elif single_file:
+        exe_name = "impulse-check-windows.exe" if system == "windows" else name
         exe_path = Path("dist") / exe_name
         if exe_path.exists():
             shutil.move(str(exe_path), str(output_dir))
+    else:
+        bundle_dir = Path("dist") / name
+        if bundle_dir.exists():
+            shutil.move(str(bundle_dir), str(output_dir))
     
     print(f"Build complete! Executable saved to {output_dir}")
 
 if __name__ == "__main__":
-    build_executable()
+    args = parse_args()
+    build_executable(single_file=args.single_file)
@@ -4,20 +4,35 @@ import json
 import curses.textpad
 from pathlib import Path
 import time
-from datetime import datetime
+from collections import deque
+import os
+import pickle
+import signal
+from datetime import datetime, timedelta
 import sys
-import argparse
+import random
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, fall back to stdlib json
+    orjson = None
 
 CONFIG_PATH = Path.home() / ".impulse_control.json"
+CACHE_PATH = Path.home() / ".impulse_control.cache.pkl"  # Parsed copy of CONFIG_PATH
+SAVE_INTERVAL = 2.0  # Seconds between background writes of pending changes
+HISTORY_LIMIT = 1000  # Undo steps kept per goal
+INPUT_TIMEOUT_MS = 500  # How long getch waits before the loop does idle work
 
 class ImpulseControlApp:
     def __init__(self, curses_scr):
         self.stdscr = curses_scr
         self.goals = {}
+        self._goal_keys = []
         self.current_goal = None
         self.current_state = 'menu'
         self.selected_index = 0
         self.textbox = None
+        self._cancelled = False
         self.goal_to_delete = None
         self.status_message = None
         self.status_time = 0
@@ -25,6 +40,12 @@ class ImpulseControlApp:
         self.content_win = None
         self.footer_win = None
         self.app_version = "v1.1.0"
+        self._dirty = False
+        self._last_save = 0
+        self._cache_stale = False  # CACHE_PATH was dropped by a save this session
+        self._needs_redraw = True
+        self._date_cache = (None, None)  # (valid until, formatted date)
+        self._ts_cache = (None, None)    # (epoch second, formatted timestamp)
         
         self.init_colors()
         self.load_data()
@@ -46,10 +67,14 @@ class ImpulseControlApp:
         curses.init_pair(8, curses.COLOR_WHITE, curses.COLOR_GREEN) # Success banner
         curses.init_pair(9, curses.COLOR_BLACK, curses.COLOR_CYAN)  # Info banner
 
+        # Precomputed attributes, indexed by pair number, for the draw methods
+        self.CP = [curses.color_pair(i) for i in range(10)]
+        self.CP_BOLD = [cp | curses.A_BOLD for cp in self.CP]
+
     def setup_window(self):
         curses.curs_set(0)  # Hide cursor
         self.stdscr.keypad(True)  # Enable special keys
-        self.stdscr.timeout(500)  # Longer timeout to reduce flicker
+        self.stdscr.timeout(INPUT_TIMEOUT_MS)  # Longer timeout to reduce flicker
         
     def create_layout(self):
         """Create a modern 3-panel layout with header, content, and footer"""
@@ -71,7 +96,7 @@ class ImpulseControlApp:
         
         # Draw header
         self.header_win.clear()
-        self.header_win.bkgd(' ', curses.color_pair(7))
+        self.header_win.bkgd(' ', self.CP[7])
         header_text = " ImpulseCheck "
         version_text = self.app_version
         self.header_win.addstr(0, 0, header_text, curses.A_BOLD)
@@ -88,29 +113,139 @@ class ImpulseControlApp:
 
     def load_data(self):
         if CONFIG_PATH.exists():
-            try:
-                with open(CONFIG_PATH, 'r') as f:
-                    data = json.load(f)
+            st = CONFIG_PATH.stat()
+            cache_key = (st.st_mtime_ns, st.st_size)
+            cached = self._load_cache(cache_key)
+            if cached is not None:
+                self.goals = cached
+            else:
+                try:
+                    # Decode from bytes so UTF-8 written by orjson loads the
+                    # same regardless of the locale encoding
+                    data = json.loads(CONFIG_PATH.read_bytes())
                     self.goals = data.get('goals', {})
-            except json.JSONDecodeError:
-                self.goals = {}
+                    self._save_cache(cache_key)
+                except ValueError:  # JSONDecodeError or UnicodeDecodeError
+                    self.goals = {}
+            for goal in self.goals.values():
+                goal['history'] = deque(goal.get('history', []), maxlen=HISTORY_LIMIT)
+        self._rebuild_keys()
         if not self.goals:
             self.current_state = 'create_goal'
 
+    def _load_cache(self, cache_key):
+        """Return goals from the pickle cache if it matches the config file, else None"""
+        try:
+            with open(CACHE_PATH, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            # A missing or unreadable cache just means parsing the JSON
+            return None
+        if not isinstance(cached, dict) or cached.get('key') != cache_key:
+            return None
+        return cached.get('goals')
+
+    def _save_cache(self, cache_key):
+        """Store the parsed goals next to the config, keyed by its mtime and size"""
+        tmp_path = CACHE_PATH.with_suffix('.pkl.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'key': cache_key, 'goals': self.goals}, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, CACHE_PATH)
+        except OSError:
+            pass  # The cache is only an optimization
+
+    def _rebuild_keys(self):
+        """Refresh the ordered goal names; call after every change to self.goals"""
+        self._goal_keys = list(self.goals)
+
+    def _date_string(self):
+        """Today's date for the footer, re-formatted only once per day"""
+        now = time.time()
+        valid_until, date_str = self._date_cache
+        if valid_until is None or now >= valid_until:
+            today = datetime.fromtimestamp(now)
+            midnight = (today + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            date_str = today.strftime("%A, %B %d, %Y")
+            self._date_cache = (midnight.timestamp(), date_str)
+        return date_str
+
+    def _timestamp(self):
+        """Current time for goal records, re-formatted only once per second"""
+        second = int(time.time())
+        cached_second, ts = self._ts_cache
+        if second != cached_second:
+            ts = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+            self._ts_cache = (second, ts)
+        return ts
+
     def save_data(self):
-        with open(CONFIG_PATH, 'w') as f:
-            json.dump({'goals': self.goals}, f)
+        """Mark goals as changed; the write happens later in _flush_if_dirty"""
+        self._dirty = True
+
+    def _flush_if_dirty(self, force=False):
+        """Write pending changes to disk, at most once every SAVE_INTERVAL seconds"""
+        if not self._dirty:
+            return
+        if not force and time.time() - self._last_save <= SAVE_INTERVAL:
+            return
+        if orjson is not None:
+            data = orjson.dumps({'goals': self.goals}, default=list, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps({'goals': self.goals}, default=list) + "\n").encode()
+        # Write to a temp file and atomically swap it in, so an interrupted
+        # write can never truncate the existing goal history
+        tmp_path = CONFIG_PATH.with_suffix('.json.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, CONFIG_PATH)
+        # Drop the now-stale parse cache; _flush_on_exit rebuilds it once
+        if not self._cache_stale:
+            try:
+                CACHE_PATH.unlink()
+            except FileNotFoundError:
+                pass
+            self._cache_stale = True
+        self._dirty = False
+        self._last_save = time.time()
+
+    def _flush_on_exit(self):
+        """Write pending changes and re-key the parse cache for the next start"""
+        self._flush_if_dirty(force=True)
+        if self._cache_stale:
+            st = CONFIG_PATH.stat()
+            self._save_cache((st.st_mtime_ns, st.st_size))
+            self._cache_stale = False
 
     def run(self):
+        # Closing the terminal (SIGHUP) or a plain kill (SIGTERM) would skip
+        # the final flush below; turn them into a normal exit instead
+        for sig in (getattr(signal, 'SIGHUP', None), signal.SIGTERM):
+            if sig is not None:
+                signal.signal(sig, _exit_on_signal)
+        try:
+            self._run_loop()
+        finally:
+            # Never lose pending changes, even on Ctrl-C or an unexpected error
+            self._flush_on_exit()
+
+    def _run_loop(self):
         last_state = None
         while True:
+            # Persist pending changes while idle between keystrokes
+            self._flush_if_dirty()
+
             # Check if we need to clear status message
             if self.status_message and time.time() - self.status_time > 3:
                 self.status_message = None
                 self.draw_status()
-                
-            # Only redraw if the state has changed or if we're in a state that needs constant updates
-            if self.current_state != last_state or self.current_state in ['menu']:
+                self._needs_redraw = True  # Restore the footer help text
+
+            # Roll the menu's footer date over at midnight
+            if self.current_state == 'menu' and time.time() >= (self._date_cache[0] or 0):
+                self._needs_redraw = True
+
+            # Only redraw if the state has changed or an event made the screen stale
+            if self.current_state != last_state or self._needs_redraw:
                 # Draw common UI elements
                 self.draw_chrome()
                 
@@ -125,6 +260,7 @@ class ImpulseControlApp:
                     self.draw_delete_confirm()
                 
                 last_state = self.current_state
+                self._needs_redraw = False
             
             # Handle input for the current state
             if self.current_state == 'menu':
@@ -133,7 +269,7 @@ class ImpulseControlApp:
                 self.handle_goal_input()
             elif self.current_state == 'create_goal':
                 self.handle_create_goal()
-                last_state = None  # Force redraw after creation
+                self._needs_redraw = True  # Force redraw after creation
             elif self.current_state == 'delete_confirm':
                 self.handle_delete_confirm()
 
@@ -145,16 +281,16 @@ class ImpulseControlApp:
         # Draw title centered with decorative borders
         title = " Goals "
         title_x = (w - len(title)) // 2
-        self.content_win.addstr(1, title_x - 15, "─" * 14, curses.color_pair(4))
-        self.content_win.addstr(1, title_x, title, curses.color_pair(4) | curses.A_BOLD)
-        self.content_win.addstr(1, title_x + len(title), "─" * 14, curses.color_pair(4))
+        self.content_win.addstr(1, title_x - 15, "─" * 14, self.CP[4])
+        self.content_win.addstr(1, title_x, title, self.CP_BOLD[4])
+        self.content_win.addstr(1, title_x + len(title), "─" * 14, self.CP[4])
         
         # Draw goals list with a box around it
         if self.goals:
             # Draw box around the goals list
-            self.content_win.attron(curses.color_pair(5))
+            self.content_win.attron(self.CP[5])
             self.content_win.box()
-            self.content_win.attroff(curses.color_pair(5))
+            self.content_win.attroff(self.CP[5])
             
             # Goal list headers
             header_y = 3
@@ -164,21 +300,21 @@ class ImpulseControlApp:
             
             # Goals
             start_y = header_y + 2
-            for idx, goal in enumerate(self.goals.keys()):
+            for idx, goal in enumerate(self._goal_keys):
                 counter = self.goals[goal]['counter']
                 
                 # Highlight selected row
                 if idx == self.selected_index:
-                    # Fill the entire row with the highlight color
-                    self.content_win.hline(start_y + idx, 1, ' ', w - 2, curses.color_pair(6))
-                    self.content_win.addstr(start_y + idx, 2, goal, curses.color_pair(6) | curses.A_BOLD)
-                    self.content_win.addstr(start_y + idx, w - 10, f"{counter}", curses.color_pair(6) | curses.A_BOLD)
+                    # Draw the text, then recolor the entire row in one call
+                    self.content_win.addstr(start_y + idx, 2, goal)
+                    self.content_win.addstr(start_y + idx, w - 10, f"{counter}")
+                    self.content_win.chgat(start_y + idx, 1, w - 2, self.CP_BOLD[6])
                 else:
                     # Normal row
                     self.content_win.addstr(start_y + idx, 2, goal)
                     
                     # Color counter based on value
-                    count_color = curses.color_pair(1)  # Default green
+                    count_color = self.CP[1]  # Default green
                     self.content_win.addstr(start_y + idx, w - 10, f"{counter}", count_color)
 
         # Empty state message
@@ -186,15 +322,15 @@ class ImpulseControlApp:
             empty_msg = "✧ No goals found ✧"
             hint_msg = "Press C to create your first goal!"
             
-            self.content_win.addstr(h//2 - 1, (w-len(empty_msg))//2, empty_msg, curses.color_pair(3) | curses.A_BOLD)
-            self.content_win.addstr(h//2 + 1, (w-len(hint_msg))//2, hint_msg, curses.color_pair(4))
+            self.content_win.addstr(h//2 - 1, (w-len(empty_msg))//2, empty_msg, self.CP_BOLD[3])
+            self.content_win.addstr(h//2 + 1, (w-len(hint_msg))//2, hint_msg, self.CP[4])
 
         # Current date in footer
-        date_str = datetime.now().strftime("%A, %B %d, %Y")
-        self.footer_win.addstr(1, w - len(date_str) - 1, date_str, curses.color_pair(5))
+        date_str = self._date_string()
+        self.footer_win.addstr(1, w - len(date_str) - 1, date_str, self.CP[5])
 
         # Help text in footer
-        self.footer_win.addstr(1, 1, help_text, curses.color_pair(2))
+        self.footer_win.addstr(1, 1, help_text, self.CP[2])
         
         # Refresh windows
         self.content_win.refresh()
@@ -208,20 +344,23 @@ class ImpulseControlApp:
 
             if key == curses.KEY_UP:
                 self.selected_index = max(0, self.selected_index - 1)
-                self.set_status(f"Selected: {list(self.goals.keys())[self.selected_index]}")
+                self._needs_redraw = True
+                if self.goals:
+                    self.set_status(f"Selected: {self._goal_keys[self.selected_index]}")
             elif key == curses.KEY_DOWN:
                 self.selected_index = min(len(self.goals)-1, self.selected_index + 1)
+                self._needs_redraw = True
                 if self.goals:
-                    self.set_status(f"Selected: {list(self.goals.keys())[self.selected_index]}")
+                    self.set_status(f"Selected: {self._goal_keys[self.selected_index]}")
             elif key in [10, 13] and self.goals:  # Enter key
-                self.current_goal = list(self.goals.keys())[self.selected_index]
+                self.current_goal = self._goal_keys[self.selected_index]
                 self.current_state = 'view_goal'
                 self.set_status(f"Viewing goal: {self.current_goal}")
             elif key in [ord('c'), ord('C')]:
                 self.current_state = 'create_goal'
                 self.set_status("Creating new goal...")
             elif key in [ord('d'), ord('D')] and self.goals:
-                self.goal_to_delete = list(self.goals.keys())[self.selected_index]
+                self.goal_to_delete = self._goal_keys[self.selected_index]
                 self.current_state = 'delete_confirm'
             elif key in [ord('q'), ord('Q')]:
                 self.set_status("Saving and quitting...", error=False)
@@ -242,18 +381,18 @@ class ImpulseControlApp:
         self.content_win.clear()
         
         # Draw a decorative border
-        self.content_win.attron(curses.color_pair(5))
+        self.content_win.attron(self.CP[5])
         self.content_win.box()
-        self.content_win.attroff(curses.color_pair(5))
+        self.content_win.attroff(self.CP[5])
         
         # Draw goal name at the top
         goal_title = f" {self.current_goal} "
         title_x = (w - len(goal_title)) // 2
         
         # Draw a fancy header with the goal name
-        self.content_win.addstr(1, title_x - 10, "╭" + "─" * 8, curses.color_pair(4))
-        self.content_win.addstr(1, title_x, goal_title, curses.color_pair(4) | curses.A_BOLD)
-        self.content_win.addstr(1, title_x + len(goal_title), "─" * 8 + "╮", curses.color_pair(4))
+        self.content_win.addstr(1, title_x - 10, "╭" + "─" * 8, self.CP[4])
+        self.content_win.addstr(1, title_x, goal_title, self.CP_BOLD[4])
+        self.content_win.addstr(1, title_x + len(goal_title), "─" * 8 + "╮", self.CP[4])
         
         # Display counter in a box in the center with a large font effect
         count_y = h // 2 - 4
@@ -272,35 +411,32 @@ class ImpulseControlApp:
         self.content_win.addch(box_y + box_height, box_x, curses.ACS_LLCORNER)
         self.content_win.addch(box_y + box_height, box_x + box_width, curses.ACS_LRCORNER)
         
-        for i in range(1, box_width):
-            self.content_win.addch(box_y, box_x + i, curses.ACS_HLINE)
-            self.content_win.addch(box_y + box_height, box_x + i, curses.ACS_HLINE)
-            
-        for i in range(1, box_height):
-            self.content_win.addch(box_y + i, box_x, curses.ACS_VLINE)
-            self.content_win.addch(box_y + i, box_x + box_width, curses.ACS_VLINE)
+        self.content_win.hline(box_y, box_x + 1, curses.ACS_HLINE, box_width - 1)
+        self.content_win.hline(box_y + box_height, box_x + 1, curses.ACS_HLINE, box_width - 1)
+        self.content_win.vline(box_y + 1, box_x, curses.ACS_VLINE, box_height - 1)
+        self.content_win.vline(box_y + 1, box_x + box_width, curses.ACS_VLINE, box_height - 1)
         
         # Draw large counter digits with simple ASCII art
         for i, digit in enumerate(count):
             digit_x = count_x + i * 4
-            self.content_win.addstr(count_y, digit_x, digit, curses.color_pair(1) | curses.A_BOLD)
+            self.content_win.addstr(count_y, digit_x, digit, self.CP_BOLD[1])
             
         # Show motivational message
         motivation_y = box_y + box_height + 2
         motivation = "Focus on your resolution!"
         self.content_win.addstr(motivation_y, (w - len(motivation)) // 2, motivation, 
-                           curses.color_pair(4) | curses.A_ITALIC)
+                           self.CP[4] | curses.A_ITALIC)
         
         # Show last updated timestamp
         if 'last_updated' in data:
             updated_str = f"Last updated: {data['last_updated']}"
             self.content_win.addstr(h - 3, (w - len(updated_str)) // 2, updated_str, 
-                              curses.color_pair(5))
+                              self.CP[5])
         
         # Help text in footer
         self.footer_win.move(1, 0)
         self.footer_win.clrtoeol()
-        self.footer_win.addstr(1, 1, help_text, curses.color_pair(2))
+        self.footer_win.addstr(1, 1, help_text, self.CP[2])
         
         # Refresh windows
         self.content_win.refresh()
@@ -311,20 +447,19 @@ class ImpulseControlApp:
         if key == -1:
             return
         
-        need_redraw = False
         data = self.goals[self.current_goal]
         if key in [ord('i'), ord('I')]:
             data['history'].append(data['counter'])
             data['counter'] +=1
-            data['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            data['last_updated'] = self._timestamp()
             self.save_data()
-            need_redraw = True
+            self._needs_redraw = True
             self.set_status(f"Counter increased to {data['counter']}")
         elif key in [ord('u'), ord('U')] and data['history']:
             data['counter'] = data['history'].pop()
-            data['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            data['last_updated'] = self._timestamp()
             self.save_data()
-            need_redraw = True
+            self._needs_redraw = True
             self.set_status(f"Counter reset to {data['counter']}")
         elif key in [ord('m'), ord('M')]:
             self.current_goal = None
@@ -342,12 +477,7 @@ class ImpulseControlApp:
                 "You're doing great, keep going!",
                 "Progress, not perfection!"
             ]
-            import random
             self.set_status(f"👋 {random.choice(motivational_messages)}", error=False)
-            
-        # Only redraw when the counter changes
-        if need_redraw:
-            self.draw_goal()
 
     # Creation state functions
     def draw_create_goal(self):
@@ -362,9 +492,9 @@ class ImpulseControlApp:
         title = " Create New Goal "
         title_x = (w - len(title)) // 2
         
-        self.content_win.addstr(1, title_x - 10, "┌" + "─" * 8, curses.color_pair(5))
-        self.content_win.addstr(1, title_x, title, curses.color_pair(5) | curses.A_BOLD)
-        self.content_win.addstr(1, title_x + len(title), "─" * 8 + "┐", curses.color_pair(5))
+        self.content_win.addstr(1, title_x - 10, "┌" + "─" * 8, self.CP[5])
+        self.content_win.addstr(1, title_x, title, self.CP_BOLD[5])
+        self.content_win.addstr(1, title_x + len(title), "─" * 8 + "┐", self.CP[5])
         
         # Draw form box
         form_y = 4
@@ -373,21 +503,18 @@ class ImpulseControlApp:
         form_x = 5
         
         # Draw the form box
-        self.content_win.attron(curses.color_pair(4))
-        for i in range(form_width):
-            self.content_win.addch(form_y, form_x + i, curses.ACS_HLINE)
-            self.content_win.addch(form_y + form_height, form_x + i, curses.ACS_HLINE)
-        
-        for i in range(form_height):
-            self.content_win.addch(form_y + i, form_x, curses.ACS_VLINE)
-            self.content_win.addch(form_y + i, form_x + form_width - 1, curses.ACS_VLINE)
+        self.content_win.attron(self.CP[4])
+        self.content_win.hline(form_y, form_x, curses.ACS_HLINE, form_width)
+        self.content_win.hline(form_y + form_height, form_x, curses.ACS_HLINE, form_width)
+        self.content_win.vline(form_y, form_x, curses.ACS_VLINE, form_height)
+        self.content_win.vline(form_y, form_x + form_width - 1, curses.ACS_VLINE, form_height)
         
         # Draw corners
         self.content_win.addch(form_y, form_x, curses.ACS_ULCORNER)
         self.content_win.addch(form_y, form_x + form_width - 1, curses.ACS_URCORNER)
         self.content_win.addch(form_y + form_height, form_x, curses.ACS_LLCORNER)
         self.content_win.addch(form_y + form_height, form_x + form_width - 1, curses.ACS_LRCORNER)
-        self.content_win.attroff(curses.color_pair(4))
+        self.content_win.attroff(self.CP[4])
         
         # Add form label
         self.content_win.addstr(form_y + 1, form_x + 2, prompt, curses.A_BOLD)
@@ -395,18 +522,18 @@ class ImpulseControlApp:
         # Add input field
         input_width = form_width - len(prompt) - 6
         win = curses.newwin(1, input_width, form_y + 1, form_x + len(prompt) + 3)
-        win.bkgd(' ', curses.color_pair(7))  # White background for input field
+        win.bkgd(' ', self.CP[7])  # White background for input field
         self.textbox = curses.textpad.Textbox(win)
         
         # Add instructions
         self.content_win.addstr(form_y + 3, form_x + 2, 
                           "Create a goal for any habit or behavior you want to track.", 
-                          curses.color_pair(5))
+                          self.CP[5])
         
         # Help text in footer
         self.footer_win.clear()
         self.footer_win.hline(0, 0, curses.ACS_HLINE, w)
-        self.footer_win.addstr(1, (w - len(help_text)) // 2, help_text, curses.color_pair(2))
+        self.footer_win.addstr(1, (w - len(help_text)) // 2, help_text, self.CP[2])
         
         # Refresh windows
         self.content_win.refresh()
@@ -419,19 +546,18 @@ class ImpulseControlApp:
         curses.curs_set(1)
         self.stdscr.nodelay(False)
         
-        # Get input from user
-        text = self.textbox.edit()
+        # Get input from user; the loop cannot flush while the textbox blocks
+        self._flush_if_dirty(force=True)
+        self._cancelled = False
+        text = self.textbox.edit(self._validate_textbox)
         
         # Hide cursor again
         curses.curs_set(0)
-        self.stdscr.nodelay(True)
+        self.stdscr.timeout(INPUT_TIMEOUT_MS)
 
-        # Convert possible numeric escape characters to proper format
-        goal_name = text.strip()
+        goal_name = '' if self._cancelled else text.strip()
         
-        # Check if text contains ESC character (ASCII 27 = \x1b)
-        # and handle cancellation properly
-        if '\x1b' in goal_name or not goal_name:
+        if not goal_name:
             self.set_status("Goal creation cancelled", error=False)
             self.current_state = 'menu'
         elif goal_name in self.goals:
@@ -440,16 +566,24 @@ class ImpulseControlApp:
             # Create new goal with current timestamp
             self.goals[goal_name] = {
                 'counter': 0, 
-                'history': [],
-                'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'last_updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                'history': deque(maxlen=HISTORY_LIMIT),
+                'created_at': self._timestamp(),
+                'last_updated': self._timestamp()
             }
+            self._rebuild_keys()
             self.save_data()
             self.current_goal = goal_name
             self.current_state = 'view_goal'
             self.set_status(f"Goal '{goal_name}' created successfully!", error=False)
 
 
+    def _validate_textbox(self, ch):
+        """Textbox key filter: ESC cancels by ending the edit like Ctrl-G"""
+        if ch == 27:
+            self._cancelled = True
+            return 7
+        return ch
+
     # Deletion confirmation functions
     def draw_delete_confirm(self):
         h, w = self.content_win.getmaxyx()
@@ -464,15 +598,14 @@ class ImpulseControlApp:
         box_y = (h - box_height) // 2
         
         # Draw warning box with red background
-        for y in range(box_height):
-            for x in range(box_width):
-                if y == 0 or y == box_height - 1 or x == 0 or x == box_width - 1:
-                    self.content_win.addch(box_y + y, box_x + x, ' ', curses.color_pair(3))
-                else:
-                    self.content_win.addch(box_y + y, box_x + x, ' ')
+        # (the interior is already blank from clear())
+        self.content_win.hline(box_y, box_x, ' ', box_width, self.CP[3])
+        self.content_win.hline(box_y + box_height - 1, box_x, ' ', box_width, self.CP[3])
+        self.content_win.vline(box_y + 1, box_x, ' ', box_height - 2, self.CP[3])
+        self.content_win.vline(box_y + 1, box_x + box_width - 1, ' ', box_height - 2, self.CP[3])
         
         # Warning icon and title
-        self.content_win.addstr(box_y + 1, box_x + 2, "⚠ WARNING", curses.color_pair(3) | curses.A_BOLD)
+        self.content_win.addstr(box_y + 1, box_x + 2, "⚠ WARNING", self.CP_BOLD[3])
         
         # Delete confirmation message
         msg = f"Delete goal '{self.goal_to_delete}'?"
@@ -486,7 +619,7 @@ class ImpulseControlApp:
         help_text = "Press Y to confirm deletion or N to cancel"
         self.footer_win.clear()
         self.footer_win.hline(0, 0, curses.ACS_HLINE, w)
-        self.footer_win.addstr(1, (w - len(help_text)) // 2, help_text, curses.color_pair(2))
+        self.footer_win.addstr(1, (w - len(help_text)) // 2, help_text, self.CP[2])
         
         # Refresh windows
         self.content_win.refresh()
@@ -494,10 +627,13 @@ class ImpulseControlApp:
 
     def handle_delete_confirm(self):
         key = self.stdscr.getch()
+        if key == -1:
+            return
         if key in [ord('y'), ord('Y')]:
             # Delete the goal
             deleted_name = self.goal_to_delete
             del self.goals[self.goal_to_delete]
+            self._rebuild_keys()
             self.save_data()
             self.selected_index = max(0, min(self.selected_index, len(self.goals)-1))
             self.set_status(f"Goal '{deleted_name}' deleted successfully", error=False)
@@ -520,20 +656,25 @@ class ImpulseControlApp:
         self.footer_win.clrtoeol()
         
         if self.status_message:
-            color = curses.color_pair(3) if self.is_error else curses.color_pair(4)
+            color = self.CP[3] if self.is_error else self.CP[4]
             self.footer_win.addstr(1, 1, self.status_message, color)
         self.footer_win.refresh()
     
     def show_error(self, message):
         """Show an error message and wait for input"""
         self.set_status(message, error=True)
+        self._flush_if_dirty(force=True)  # Don't hold unsaved changes while blocked
         self.stdscr.getch()
 
     def quit(self):
-        self.save_data()
+        self._flush_on_exit()
         raise KeyboardInterrupt
 
+def _exit_on_signal(signum, frame):
+    raise SystemExit(128 + signum)
+
 def parse_args():
+    import argparse  # Only needed for the CLI entry point
     parser = argparse.ArgumentParser(description='Impulse Check - Track your impulses and build better habits')
     parser.add_argument('--version', action='store_true', help='Show version and exit')
     return parser.parse_args()
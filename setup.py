@@ -1,4 +1,34 @@
+import py_compile
+import sys
+
 from setuptools import setup, find_packages
+from setuptools.command.install_lib import install_lib
+
+
+class HashedPycInstallLib(install_lib):
+    """Byte-compile installed modules with unchecked hash-based .pyc files
+
+    Only takes effect for legacy ``python setup.py install``. pip installs
+    (wheel builds and editable installs) skip install_lib byte-compilation
+    and pip writes its own timestamp-based .pyc files instead.
+    """
+
+    def run(self):
+        super().run()
+        # Respect --no-compile and -B like the base command; hash-based
+        # invalidation needs Python 3.7+
+        if not self.compile or sys.dont_write_bytecode:
+            return
+        if not hasattr(py_compile, "PycInvalidationMode"):
+            return
+        # Only touch files this command installed, never the rest of site-packages
+        for path in self.get_outputs():
+            if path.endswith(".py"):
+                py_compile.compile(
+                    path,
+                    invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+                )
+
 
 setup(
     name="impulse-check",
@@ -7,11 +37,17 @@ setup(
     install_requires=[
         "windows-curses;platform_system=='Windows'",
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "impulse-check=main:cli",
         ],
     },
+    cmdclass={
+        "install_lib": HashedPycInstallLib,
+    },
     author="Lucas Bonatto",
     author_email="lucas.bonatto@example.com",
     description="A TUI app to track impulses and build better habits",